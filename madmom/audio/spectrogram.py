@@ -265,6 +265,8 @@ class SpectrogramProcessor(Processor):
 
 # filtered spectrogram stuff
 FILTERBANK = LogarithmicFilterbank
+# cache for created filterbanks, shared between all processor instances
+_FILTERBANK_CACHE = {}
 
 
 class FilteredSpectrogram(Spectrogram):
@@ -369,11 +371,21 @@ class FilteredSpectrogram(Spectrogram):
             spectrogram = Spectrogram(spectrogram, **kwargs)
         # instantiate a Filterbank if needed
         if inspect.isclass(filterbank) and issubclass(filterbank, Filterbank):
-            # a Filterbank class is given, create a filterbank of this type
-            filterbank = filterbank(spectrogram.bin_frequencies,
-                                    num_bands=num_bands, fmin=fmin, fmax=fmax,
-                                    fref=fref, norm_filters=norm_filters,
-                                    unique_filters=unique_filters)
+            # a Filterbank class is given, create a filterbank of this type;
+            # cache the created filterbanks (they are used read-only), so
+            # multiple processor instances with identical parameters share a
+            # single filterbank instead of each rebuilding it
+            key = (filterbank, spectrogram.bin_frequencies.tobytes(),
+                   num_bands, fmin, fmax, fref, norm_filters, unique_filters)
+            try:
+                filterbank = _FILTERBANK_CACHE[key]
+            except KeyError:
+                filterbank = filterbank(spectrogram.bin_frequencies,
+                                        num_bands=num_bands, fmin=fmin,
+                                        fmax=fmax, fref=fref,
+                                        norm_filters=norm_filters,
+                                        unique_filters=unique_filters)
+                _FILTERBANK_CACHE[key] = filterbank
         if not isinstance(filterbank, Filterbank):
             raise TypeError('not a Filterbank type or instance: %s' %
                             filterbank)
@@ -1068,12 +1080,14 @@ class SpectrogramDifferenceProcessor(Processor):
         # attributes needed for stateful processing
         # Note: do not init the buffer here, since it depends on the data
         self._buffer = None
+        self._inf_diffs = 0
 
     def __getstate__(self):
         # copy everything to a picklable object
         state = self.__dict__.copy()
         # do not pickle attributes needed for stateful processing
         state.pop('_buffer', None)
+        state.pop('_inf_diffs', None)
         return state
 
     def __setstate__(self, state):
@@ -1081,6 +1095,7 @@ class SpectrogramDifferenceProcessor(Processor):
         self.__dict__.update(state)
         # add non-pickled attributes needed for stateful processing
         self._buffer = None
+        self._inf_diffs = 0
 
     def process(self, data, reset=True, **kwargs):
         """
@@ -1124,13 +1139,20 @@ class SpectrogramDifferenceProcessor(Processor):
             data = np.insert(data, 0, init, axis=0)
             # use the data for the buffer
             self._buffer = BufferProcessor(init=data)
+            # the next diff_frames diffs can contain infs from the inf init
+            self._inf_diffs = self.diff_frames
         else:
             # shift buffer by length of data and put new data at end of buffer
             data = self._buffer(data)
         # compute difference based on this data (reduce 1st dimension)
         diff = SpectrogramDifference(data, keep_dims=False, **args)
-        # set all inf-diffs to 0
-        diff[np.isinf(diff)] = 0
+        # set all inf-diffs (originating from the inf buffer init) to 0;
+        # infs can only occur in the first diff_frames diffs after a reset,
+        # so skip the check (and its full-size temporary array) afterwards
+        if self._inf_diffs:
+            init_diff = diff[:self._inf_diffs]
+            init_diff[np.isinf(init_diff)] = 0
+            self._inf_diffs = max(0, self._inf_diffs - len(diff))
         # stack the diff and the data if needed
         if self.stack_diffs is None:
             return diff
@@ -1300,23 +1322,27 @@ class MultiBandSpectrogram(FilteredSpectrogram):
 
     def __init__(self, spectrogram, crossover_frequencies, fmin=FMIN,
                  fmax=FMAX, norm_filters=NORM_FILTERS,
-                 unique_filters=UNIQUE_FILTERS, **kwargs):
+                 unique_filters=UNIQUE_FILTERS, filterbank=None, **kwargs):
         # this method is for documentation purposes only
         pass
 
     def __new__(cls, spectrogram, crossover_frequencies, fmin=FMIN, fmax=FMAX,
                 norm_filters=NORM_FILTERS, unique_filters=UNIQUE_FILTERS,
-                **kwargs):
+                filterbank=None, **kwargs):
         from .filters import RectangularFilterbank
         # instantiate a Spectrogram if needed
         if not isinstance(spectrogram, Spectrogram):
             spectrogram = Spectrogram(spectrogram, **kwargs)
-        # create a rectangular filterbank
-        filterbank = RectangularFilterbank(spectrogram.bin_frequencies,
-                                           crossover_frequencies,
-                                           fmin=fmin, fmax=fmax,
-                                           norm_filters=norm_filters,
-                                           unique_filters=unique_filters)
+        # create a rectangular filterbank (unless a matching one is given,
+        # i.e. one built from the very same bin frequencies)
+        if (filterbank is None or
+                not np.array_equal(filterbank.bin_frequencies,
+                                   spectrogram.bin_frequencies)):
+            filterbank = RectangularFilterbank(spectrogram.bin_frequencies,
+                                               crossover_frequencies,
+                                               fmin=fmin, fmax=fmax,
+                                               norm_filters=norm_filters,
+                                               unique_filters=unique_filters)
         # filter the spectrogram
         data = np.dot(spectrogram, filterbank)
         # cast as FilteredSpectrogram
@@ -1370,6 +1396,8 @@ class MultiBandSpectrogramProcessor(Processor):
         self.fmax = fmax
         self.norm_filters = norm_filters
         self.unique_filters = unique_filters
+        self._filterbank = None
+        self._filterbank_key = None
 
     def process(self, data, **kwargs):
         """
@@ -1394,8 +1422,18 @@ class MultiBandSpectrogramProcessor(Processor):
                     norm_filters=self.norm_filters,
                     unique_filters=self.unique_filters)
         args.update(kwargs)
+        # reuse the cached filterbank only if the parameters are unchanged
+        key = (tuple(np.atleast_1d(args['crossover_frequencies'])),
+               args['fmin'], args['fmax'], args['norm_filters'],
+               args['unique_filters'])
+        if key == self._filterbank_key:
+            args['filterbank'] = self._filterbank
         # instantiate a MultiBandSpectrogram
-        return MultiBandSpectrogram(data, **args)
+        data = MultiBandSpectrogram(data, **args)
+        # cache the filterbank
+        self._filterbank = data.filterbank
+        self._filterbank_key = key
+        return data
 
 
 class SemitoneBandpassSpectrogram(FilteredSpectrogram):
@@ -101,6 +101,31 @@ def stft(frames, window, fft_size=None, circular_shift=False,
     # init objects
     data = np.empty((num_frames, num_fft_bins), STFT_DTYPE)
 
+    # process the frames block-wise if no circular shift is needed (and no
+    # FFTW plan for single frames is given); computing the DFTs of a whole
+    # block of frames with a single call amortizes the per-call overhead
+    # and yields the same results as the frame-by-frame computation
+    if not circular_shift and not fftw:
+        block_size = 16
+        for start in range(0, num_frames, block_size):
+            stop = min(start + block_size, num_frames)
+            # stack the frames of this block as a 2D array
+            block = np.vstack([frames[f] for f in range(start, stop)])
+            # multiply the signal frames with the window
+            if window is not None:
+                block = np.multiply(block, window)
+            # perform DFT
+            if np.iscomplexobj(block):
+                data[start:stop] = fftpack.fft(block, fft_size,
+                                               axis=1)[:, :num_fft_bins]
+            else:
+                # real-valued input: the rFFT computes only the (positive
+                # half of the) spectrum we keep anyways, at half the cost
+                data[start:stop] = np.fft.rfft(block, fft_size,
+                                               axis=1)[:, :num_fft_bins]
+        # return STFT
+        return data
+
     # iterate over all frames
     for f, frame in enumerate(frames):
         if circular_shift:
@@ -127,8 +152,12 @@ def stft(frames, window, fft_size=None, circular_shift=False,
         # perform DFT
         if fftw:
             data[f] = fftw(fft_signal)[:num_fft_bins]
-        else:
+        elif np.iscomplexobj(fft_signal):
             data[f] = fftpack.fft(fft_signal, fft_size, axis=0)[:num_fft_bins]
+        else:
+            # real-valued input: the rFFT computes only the (positive half of
+            # the) spectrum we keep anyways, at roughly half the cost
+            data[f] = np.fft.rfft(fft_signal, fft_size)[:num_fft_bins]
     # return STFT
     return data
 
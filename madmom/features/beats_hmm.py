@@ -17,6 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 import numpy as np
 
+from madmom.ml.gmm import log_multivariate_normal_density
 from madmom.ml.hmm import ObservationModel, TransitionModel
 
 
@@ -197,7 +198,10 @@ class MultiPatternStateSpace(object):
         self.state_spaces = state_spaces
         self.state_positions = np.empty(0)
         self.state_intervals = np.empty(0, dtype=np.int)
-        self.state_patterns = np.empty(0, dtype=np.int)
+        # Note: use a narrow dtype for the pattern table; it is gathered for
+        #       every state of the decoded path, so a smaller footprint keeps
+        #       more of it cache-resident
+        self.state_patterns = np.empty(0, dtype=np.int32)
         self.num_states = 0
         # save the first and last states of the individual patterns in a list
         self.first_states = []
@@ -209,8 +213,8 @@ class MultiPatternStateSpace(object):
                                               pss.state_positions))
             self.state_intervals = np.hstack((self.state_intervals,
                                               pss.state_intervals))
-            self.state_patterns = np.hstack((self.state_patterns,
-                                             np.repeat(p, pss.num_states)))
+            self.state_patterns = np.hstack((
+                self.state_patterns, np.repeat(np.int32(p), pss.num_states)))
             # append the first and last states of each pattern
             self.first_states.append(pss.first_states[0] + self.num_states)
             self.last_states.append(pss.last_states[-1] + self.num_states)
@@ -663,31 +667,85 @@ class GMMPatternTrackingObservationModel(ObservationModel):
         self.pattern_files = pattern_files
         self.state_space = state_space
         # define the pointers of the log densities
-        pointers = np.zeros(state_space.num_states, dtype=np.uint32)
         patterns = self.state_space.state_patterns
         positions = self.state_space.state_positions
+        # number of fitted GMMs for each pattern
+        num_gmms = np.array([len(gmms) for gmms in pattern_files])
+        # number of beats of each pattern
+        # TODO: save the number of beats in the pattern files so we don't
+        #       need to save references to all state spaces
+        num_beats = np.array([st.num_beats
+                              for st in self.state_space.state_spaces])
         # Note: the densities of all GMMs are just stacked on top of each
-        #       other, so we have to to keep track of the total number of GMMs
-        densities_idx_offset = 0
-        for p, gmms in enumerate(pattern_files):
-            # number of fitted GMMs for this pattern
-            num_gmms = len(gmms)
-            # number of beats in this pattern
-            # TODO: save the number of beats in the pattern files so we don't
-            #       need to save references to all state spaces
-            num_beats = self.state_space.state_spaces[p].num_beats
-            # distribute the observation densities defined by the GMMs
-            # uniformly across the entire state space (for this pattern)
-            # since the densities are just stacked, add the offset
-            # Note: we have to divide by the number of beats, since the
-            #       positions range is [0, num_beats]
-            pointers[patterns == p] = (positions[patterns == p] * num_gmms /
-                                       num_beats + densities_idx_offset)
-            # increase the offset by the number of GMMs
-            densities_idx_offset += num_gmms
+        #       other, the pointers of each pattern must thus be offset by
+        #       the total number of GMMs of all previous patterns
+        densities_idx_offset = np.concatenate(([0], np.cumsum(num_gmms)[:-1]))
+        # distribute the observation densities defined by the GMMs uniformly
+        # across the entire state space (of the respective pattern)
+        # Note: we have to divide by the number of beats, since the positions
+        #       range is [0, num_beats]
+        pointers = np.asarray(positions * num_gmms[patterns] /
+                              num_beats[patterns] +
+                              densities_idx_offset[patterns], dtype=np.uint32)
+        # pre-compute a stacked representation of all GMMs to be able to
+        # score all mixture components of all patterns at once
+        self._stack_gmms()
         # instantiate a ObservationModel with the pointers
         super(GMMPatternTrackingObservationModel, self).__init__(pointers)
 
+    def _stack_gmms(self):
+        """
+        Stack the parameters of all GMMs to allow batched scoring.
+
+        The means, covariances and (log) weights of all mixture components of
+        all GMMs are stacked on top of each other, so that the log densities
+        of all GMMs can be computed with a single call to
+        :func:`madmom.ml.gmm.log_multivariate_normal_density` followed by a
+        segmented logsumexp over the components of the individual GMMs.
+
+        """
+        # flatten the GMMs of all patterns
+        gmms = [gmm for pattern in self.pattern_files for gmm in pattern]
+        # batched scoring requires all GMMs to share the covariance type and
+        # feature dimensionality; fall back to individual scoring otherwise
+        covariance_type = gmms[0].covariance_type
+        feat_dim = gmms[0].means.shape[1]
+        if (covariance_type not in ('diag', 'spherical', 'full') or
+                any(gmm.covariance_type != covariance_type or
+                    gmm.means.shape[1] != feat_dim for gmm in gmms)):
+            self._means = None
+            return
+        # stack the parameters of the individual mixture components
+        self._covariance_type = covariance_type
+        self._means = np.vstack([gmm.means for gmm in gmms])
+        self._covars = np.concatenate([gmm.covars for gmm in gmms])
+        self._log_weights = np.log(np.concatenate([gmm.weights
+                                                   for gmm in gmms]))
+        # keep track which components belong to which GMM
+        num_components = [len(gmm.weights) for gmm in gmms]
+        self._component_starts = np.r_[0, np.cumsum(num_components)[:-1]]
+        self._component_gmms = np.repeat(np.arange(len(gmms)), num_components)
+        # for (diagonal) covariances, precompute the natural parameters and
+        # log normalisation constants of all components, so scoring reduces
+        # to two matrix products plus a constant per component
+        if covariance_type in ('diag', 'spherical'):
+            covars = self._covars
+            # bring spherical covariances into diagonal form
+            if covars.ndim == 1:
+                covars = covars[:, np.newaxis]
+            if covars.shape[1] == 1:
+                covars = np.tile(covars, (1, feat_dim))
+            # Note: store the parameters as float32; the component space is
+            #       the dominant memory traffic when scoring and single
+            #       precision is accurate enough for the relative log
+            #       probabilities the Viterbi decoding operates on
+            self._inv_covars = (1. / covars).T.astype(np.float32)
+            self._means_covars = (self._means / covars).T.astype(np.float32)
+            self._log_norm = (self._log_weights - 0.5 * (
+                feat_dim * np.log(2 * np.pi) +
+                np.sum(np.log(covars), axis=1) +
+                np.sum(self._means ** 2 / covars, axis=1))).astype(np.float32)
+
     def log_densities(self, observations):
         """
         Compute the log densities of the observations using (a) GMM(s).
@@ -704,6 +762,32 @@ class GMMPatternTrackingObservationModel(ObservationModel):
             observation log probability densities for the individual GMMs.
 
         """
+        # score all GMMs at once if a stacked representation is available
+        if self._means is not None:
+            observations = np.asarray(observations)
+            if observations.ndim == 1:
+                observations = observations[:, np.newaxis]
+            # compute the weighted log probabilities of all components of all
+            # GMMs with a single (vectorized) call
+            if self._covariance_type == 'full':
+                lpr = (log_multivariate_normal_density(
+                    observations, self._means, self._covars,
+                    self._covariance_type) + self._log_weights)
+            else:
+                # diagonal covariances: use the precomputed natural
+                # parameters, i.e. two matrix products plus a constant;
+                # perform the per-component math in single precision to
+                # halve the bytes moved through memory
+                observations = observations.astype(np.float32, copy=False)
+                lpr = (np.dot(observations, self._means_covars) -
+                       0.5 * np.dot(observations ** 2, self._inv_covars) +
+                       self._log_norm)
+            # segmented logsumexp over the components of the individual GMMs
+            vmax = np.maximum.reduceat(lpr, self._component_starts, axis=1)
+            lse = np.add.reduceat(np.exp(lpr - vmax[:, self._component_gmms]),
+                                  self._component_starts, axis=1)
+            # return the densities as doubles (required by the HMM kernels)
+            return (np.log(lse) + vmax).astype(np.float, copy=False)
         # number of GMMs of all patterns
         num_gmms = sum([len(pattern) for pattern in self.pattern_files])
         # init the densities
@@ -9,6 +9,8 @@ This module contains downbeat and bar tracking related functionality.
 
 from __future__ import absolute_import, division, print_function
 
+import functools
+import os
 import sys
 import warnings
 
@@ -320,8 +322,8 @@ class DBNDownBeatTrackingProcessor(Processor):
             #        to decide whether to include these points
             beats = np.nonzero(np.diff(beat_numbers))[0] + 1
         # return the beat positions (converted to seconds) and beat numbers
-        return np.vstack(((beats + first) / float(self.fps),
-                          beat_numbers[beats])).T
+        return np.column_stack(((beats + first) / float(self.fps),
+                                beat_numbers[beats]))
 
     @staticmethod
     def add_arguments(parser, beats_per_bar, min_bpm=MIN_BPM, max_bpm=MAX_BPM,
@@ -437,6 +439,37 @@ class DBNDownBeatTrackingProcessor(Processor):
         return g
 
 
+@functools.lru_cache(maxsize=32)
+def _load_pattern(pattern_file, mtime):
+    """
+    Load (and cache) a pickled rhythmic pattern file.
+
+    Parameters
+    ----------
+    pattern_file : str
+        Rhythmic pattern file (pickled).
+    mtime : float
+        Modification time of the file; part of the cache key so a modified
+        file is loaded from disk again instead of served from the cache.
+
+    Returns
+    -------
+    dict
+        Rhythmic pattern (i.e. fitted GMMs and number of beats).
+
+    """
+    # pylint: disable=unused-argument
+    import pickle
+    with open(pattern_file, 'rb') as f:
+        # Python 2 and 3 behave differently
+        try:
+            # Python 3
+            return pickle.load(f, encoding='latin1')
+        except TypeError:
+            # Python 2 doesn't have/need the encoding
+            return pickle.load(f)
+
+
 class PatternTrackingProcessor(Processor):
     """
     Pattern tracking with a dynamic Bayesian network (DBN) approximated by a
@@ -529,7 +562,6 @@ SpectrogramDifferenceProcessor, MultiBandSpectrogramProcessor
                  fps=None, **kwargs):
         # pylint: disable=unused-argument
         # pylint: disable=no-name-in-module
-        import pickle
         min_bpm = np.array(min_bpm, ndmin=1)
         max_bpm = np.array(max_bpm, ndmin=1)
         num_tempi = np.array(num_tempi, ndmin=1)
@@ -563,16 +595,11 @@ SpectrogramDifferenceProcessor, MultiBandSpectrogramProcessor
         # check that at least one pattern is given
         if not pattern_files:
             raise ValueError('at least one rhythmical pattern must be given.')
-        # load the patterns
+        # load the patterns (cached, keyed by file path and modification
+        # time, so repeated instantiations skip the pickle deserialization)
         for p, pattern_file in enumerate(pattern_files):
-            with open(pattern_file, 'rb') as f:
-                # Python 2 and 3 behave differently
-                try:
-                    # Python 3
-                    pattern = pickle.load(f, encoding='latin1')
-                except TypeError:
-                    # Python 2 doesn't have/need the encoding
-                    pattern = pickle.load(f)
+            pattern = _load_pattern(pattern_file,
+                                    os.path.getmtime(pattern_file))
             # get the fitted GMMs and number of beats
             gmms.append(pattern['gmms'])
             num_beats = pattern['num_beats']
@@ -619,8 +646,8 @@ SpectrogramDifferenceProcessor, MultiBandSpectrogramProcessor
         #        decide whether to include these points
         beat_positions = np.nonzero(np.diff(beat_numbers))[0] + 1
         # return the beat positions (converted to seconds) and beat numbers
-        return np.vstack((beat_positions / float(self.fps),
-                          beat_numbers[beat_positions])).T
+        return np.column_stack((beat_positions / float(self.fps),
+                                beat_numbers[beat_positions]))
 
     @staticmethod
     def add_arguments(parser, pattern_files=None, min_bpm=MIN_BPM,
@@ -697,6 +724,40 @@ SpectrogramDifferenceProcessor, MultiBandSpectrogramProcessor
         return g
 
 
+def _load_text_values(filename):
+    """
+    Load whitespace-separated values from a text file.
+
+    Parameters
+    ----------
+    filename : str
+        File to load the values from.
+
+    Returns
+    -------
+    numpy array
+        Values read from the file.
+
+    Notes
+    -----
+    Behaves like :func:`numpy.loadtxt`, but parses clean files (i.e. only
+    numbers and full-line comments) considerably faster by splitting the
+    whole file at once instead of looping over the lines in Python; files
+    np.loadtxt accepts but this shortcut cannot parse (e.g. files with
+    inline comments) are handed over to np.loadtxt.
+
+    """
+    try:
+        with open(filename) as f:
+            rows = [line.split() for line in f]
+        rows = [row for row in rows if row and not row[0].startswith('#')]
+        # Note: squeeze to mimic np.loadtxt, which returns 1D arrays for
+        #       single-column (and single-row) files
+        return np.squeeze(np.array(rows, dtype=float))
+    except ValueError:
+        return np.loadtxt(filename)
+
+
 # bar tracking, i.e. track downbeats from signal given beat positions
 class LoadBeatsProcessor(Processor):
     """
@@ -779,7 +840,7 @@ class LoadBeatsProcessor(Processor):
             raise SystemExit("can't find a beat file for %s" % filename)
         # load the beats and return them
         # TODO: Use load_beats function
-        beats = np.loadtxt(matches[0])
+        beats = _load_text_values(matches[0])
         if beats.ndim == 2:
             # only use beat times, omit the beat positions inside the bar
             beats = beats[:, 0]
@@ -866,47 +927,57 @@ class SyncronizeFeaturesProcessor(Processor):
         # beats can be 1D (only beat times) or 2D (times, position inside bar)
         if beats.ndim > 1:
             beats = beats[:, 0]
-        # trim beat sequence
-        while (float(len(features)) / self.fps) < beats[-1]:
-            beats = beats[:-1]
+        # trim beat sequence (all beats must fall inside the features)
+        num_keep = np.searchsorted(beats, float(len(features)) / self.fps,
+                                   side='right')
+        if num_keep < len(beats):
+            beats = beats[:num_keep]
             warnings.warn('Beat sequence too long compared to features.')
         # number of beats
         num_beats = len(beats)
+        beat_subdivisions = self.beat_subdivisions
         # feature dimension (make sure features are 2D)
         features = np.array(features.T, copy=False, ndmin=2).T
         feat_dim = features.shape[-1]
-        # init a 3D feature aggregation array
-        beat_features = np.zeros(
-            (num_beats - 1, self.beat_subdivisions, feat_dim))
+        # aggregate all feature values that fall into a window of
+        # length = beat_duration / beat_subdivisions, centered on the beat
+        # annotations or interpolated subdivisions; instead of looping over
+        # the beats, assign each frame to its (beat, subdivision) bucket and
+        # aggregate all buckets with a single segmented reduction
         # start first beat 20ms before actual annotation
         beat_start = int(max(0, np.floor((beats[0] - 0.02) * self.fps)))
-        # TODO: speed this up, could probably be done without a loop
-        for i in range(num_beats - 1):
-            # aggregate all feature values that fall into a window of
-            # length = beat_duration / beat_subdivisions, centered on the beat
-            # annotations or interpolated subdivisions
-            beat_duration = beats[i + 1] - beats[i]
-            offset = 0.5 * beat_duration / self.beat_subdivisions
-            # offset should be < 50 ms
-            offset = np.min([offset, 0.05])
-            # last frame of beat
-            beat_end = int(np.floor((beats[i + 1] - offset) * self.fps))
-            # we need to put each feature frame into its corresponding
-            # beat subdivison; linearly align the subdivisions up to the
-            # length of the beat
-            subdiv = np.floor(np.linspace(0, self.beat_subdivisions,
-                                          beat_end - beat_start,
-                                          endpoint=False))
-            beat = features[beat_start:beat_end]
-            # group features by beat subdivisions and aggregate them
-            subdiv_features = [beat[subdiv == div] for div in
-                               range(self.beat_subdivisions)]
-            beat_features[i, :, :] = np.array([np.mean(x, axis=0) for x in
-                                               subdiv_features])
-            # progress to next beat
-            beat_start = beat_end
-        # return beats and beat-synchronous features
-        return beat_features
+        # last frame of each beat; the aggregation window ends half a
+        # subdivision (at most 50 ms) before the next beat
+        offsets = np.minimum(0.5 * np.diff(beats) / beat_subdivisions, 0.05)
+        beat_ends = np.floor((beats[1:] - offsets) * self.fps).astype(int)
+        # frame boundaries of the beats and number of frames per beat
+        boundaries = np.r_[beat_start, beat_ends]
+        counts = np.diff(boundaries)
+        # beat and subdivision each frame belongs to; linearly align the
+        # subdivisions up to the length of the beat
+        beat_idx = np.repeat(np.arange(num_beats - 1), counts)
+        pos = (np.arange(beat_start, boundaries[-1]) -
+               np.repeat(boundaries[:-1], counts))
+        with np.errstate(divide='ignore'):
+            subdiv = np.floor(pos * (beat_subdivisions / counts)[beat_idx])
+        # sum the features of all frames falling into the same bucket
+        # (the buckets are sorted, so a segmented reduction can be used)
+        num_buckets = (num_beats - 1) * beat_subdivisions
+        buckets = beat_idx * beat_subdivisions + subdiv.astype(int)
+        starts = np.searchsorted(buckets, np.arange(num_buckets))
+        # Note: pad the features with a zero frame, so trailing empty buckets
+        #       produce a valid reduceat index; the zero frame never
+        #       contributes to a preceding non-empty bucket
+        feats = np.vstack((features[beat_start:boundaries[-1]],
+                           np.zeros((1, feat_dim), dtype=features.dtype)))
+        sums = np.add.reduceat(feats, starts, axis=0)
+        # average the buckets; empty ones are set to NaN (as np.mean does)
+        bucket_counts = np.bincount(buckets, minlength=num_buckets)
+        beat_features = sums / np.maximum(bucket_counts, 1)[:, np.newaxis]
+        beat_features[bucket_counts == 0] = np.nan
+        # return the beat-synchronous features
+        return beat_features.reshape((num_beats - 1, beat_subdivisions,
+                                      feat_dim))
 
 
 class RNNBarProcessor(Processor):
@@ -1029,7 +1100,49 @@ class RNNBarProcessor(Processor):
         # of beats, append an artificial value
         act = np.mean([perc, harm], axis=0)
         act = np.append(act, np.ones(1) * np.nan)
-        return np.vstack((beats, act)).T
+        return np.column_stack((beats, act))
+
+
+@functools.lru_cache(maxsize=16)
+def _bar_tracking_models(beats_per_bar, meter_change_prob):
+    """
+    Build (and cache) the state space and transition model for bar tracking.
+
+    Parameters
+    ----------
+    beats_per_bar : tuple of int
+        Number of beats per bar to be modeled.
+    meter_change_prob : float
+        Probability to change meter at bar boundaries.
+
+    Returns
+    -------
+    st : :class:`.beats_hmm.MultiPatternStateSpace` instance
+        Multi pattern state space.
+    tm : :class:`.beats_hmm.MultiPatternTransitionModel` instance
+        Multi pattern transition model.
+
+    Notes
+    -----
+    The models are deterministic functions of the arguments, but building
+    the transition matrices is costly; cache them so repeated processor
+    instantiations (e.g. one per file in batch mode) reuse the same models.
+
+    """
+    state_spaces = []
+    transition_models = []
+    for beats in beats_per_bar:
+        # Note: tempo and transition_lambda is not relevant
+        st = BarStateSpace(beats, min_interval=1, max_interval=1)
+        tm = BarTransitionModel(st, transition_lambda=1)
+        state_spaces.append(st)
+        transition_models.append(tm)
+    # Note: treat different bar lengths as different patterns and use the
+    #       existing MultiPatternStateSpace and MultiPatternTransitionModel
+    st = MultiPatternStateSpace(state_spaces)
+    tm = MultiPatternTransitionModel(
+        transition_models, transition_prob=meter_change_prob)
+    return st, tm
 
 
 class DBNBarTrackingProcessor(Processor):
@@ -1089,20 +1202,9 @@ class DBNBarTrackingProcessor(Processor):
         if isinstance(beats_per_bar, integer_types):
             beats_per_bar = (beats_per_bar, )
         self.beats_per_bar = beats_per_bar
-        # state space & transition model for each bar length
-        state_spaces = []
-        transition_models = []
-        for beats in self.beats_per_bar:
-            # Note: tempo and transition_lambda is not relevant
-            st = BarStateSpace(beats, min_interval=1, max_interval=1)
-            tm = BarTransitionModel(st, transition_lambda=1)
-            state_spaces.append(st)
-            transition_models.append(tm)
-        # Note: treat different bar lengths as different patterns and use the
-        #       existing MultiPatternStateSpace and MultiPatternTransitionModel
-        self.st = MultiPatternStateSpace(state_spaces)
-        self.tm = MultiPatternTransitionModel(
-            transition_models, transition_prob=meter_change_prob)
+        # state space & transition model (cached across instantiations)
+        self.st, self.tm = _bar_tracking_models(tuple(self.beats_per_bar),
+                                                meter_change_prob)
         # observation model
         self.om = RNNBeatTrackingObservationModel(self.st, observation_weight)
         # instantiate a HMM
@@ -1141,14 +1243,16 @@ class DBNBarTrackingProcessor(Processor):
         path, _ = self.hmm.viterbi(activations)
         # get the position inside the bar
         position = self.st.state_positions[path]
-        # the beat numbers are the counters + 1 at the transition points
-        beat_numbers = position.astype(int) + 1
-        # add the last beat (which has no activation function value)
+        # the beat numbers are the counters + 1 at the transition points;
+        # preallocate space for the last beat (which has no activation
+        # function value) instead of appending it afterwards
+        beat_numbers = np.empty(len(path) + 1, dtype=np.int)
+        beat_numbers[:-1] = position.astype(int) + 1
+        # extrapolate the last beat based on the meter of the second to last
         meter = self.beats_per_bar[self.st.state_patterns[path[-1]]]
-        last_beat_number = np.mod(beat_numbers[-1], meter) + 1
-        beat_numbers = np.append(beat_numbers, last_beat_number)
+        beat_numbers[-1] = beat_numbers[-2] % meter + 1
         # return beats and their beat numbers
-        return np.vstack((beats, beat_numbers)).T
+        return np.column_stack((beats, beat_numbers))
 
     @classmethod
     def add_arguments(cls, parser, beats_per_bar,
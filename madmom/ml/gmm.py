@@ -193,7 +193,9 @@ def _log_multivariate_normal_density_full(x, means, covars, min_covar=1.e-7):
 
         cv_log_det = 2 * np.sum(np.log(np.diagonal(cv_chol)))
         cv_sol = linalg.solve_triangular(cv_chol, (x - mu).T, lower=True).T
-        log_prob[:, c] = - .5 * (np.sum(cv_sol ** 2, axis=1) +
+        # Note: einsum computes the squared Mahalanobis distances without the
+        #       temporary array a naive np.sum(cv_sol ** 2, axis=1) creates
+        log_prob[:, c] = - .5 * (np.einsum('ij,ij->i', cv_sol, cv_sol) +
                                  n_dim * np.log(2 * np.pi) + cv_log_det)
 
     return log_prob
@@ -112,6 +112,32 @@ class NeuralNetwork(Processor):
         for layer in self.layers:
             layer.reset()
 
+    def cast(self, dtype=layers.NN_DTYPE):
+        """
+        Cast the network parameters to the given dtype.
+
+        Parameters
+        ----------
+        dtype : numpy dtype, optional
+            Dtype to cast all floating point parameters of the network to.
+
+        Returns
+        -------
+        network : :class:`NeuralNetwork`
+            The network itself, with the parameters of all layers cast to
+            `dtype`.
+
+        Notes
+        -----
+        Casting networks saved in double precision to single precision (the
+        default) halves their memory footprint and bandwidth, usually without
+        affecting the predictions.
+
+        """
+        for layer in self.layers:
+            layer.cast(dtype)
+        return self
+
 
 class NeuralNetworkEnsemble(SequentialProcessor):
     """
@@ -51,6 +51,39 @@ class Layer(object):
         """
         return None
 
+    def cast(self, dtype=NN_DTYPE):
+        """
+        Cast the parameters of the layer to the given dtype.
+
+        Parameters
+        ----------
+        dtype : numpy dtype, optional
+            Dtype to cast all floating point parameters (weights, biases,
+            states) of the layer to.
+
+        Returns
+        -------
+        layer : :class:`Layer`
+            The layer itself, with all floating point parameters cast to
+            `dtype`.
+
+        Notes
+        -----
+        Casting the parameters of networks saved in double precision to
+        single precision (the default) halves the memory bandwidth needed to
+        activate the layer, usually without affecting the predictions.
+        Sub-layers (e.g. the gates of a :class:`LSTMLayer`) are cast
+        recursively.
+
+        """
+        for name, value in self.__dict__.items():
+            if (isinstance(value, np.ndarray) and
+                    np.issubdtype(value.dtype, np.floating)):
+                setattr(self, name, value.astype(dtype))
+            elif isinstance(value, Layer):
+                value.cast(dtype)
+        return self
+
 
 class FeedForwardLayer(Layer):
     """
@@ -177,8 +210,8 @@ class RecurrentLayer(FeedForwardLayer):
         for i in range(len(data)):
             # add weighted previous step
             out[i] += np.dot(self._prev, self.recurrent_weights)
-            # apply activation function
-            out[i] = self.activation_fn(out[i])
+            # apply activation function (in place)
+            self.activation_fn(out[i], out[i])
             # set reference to current output
             self._prev = out[i]
         # return
@@ -282,14 +315,15 @@ class Gate(RecurrentLayer):
 
         """
         # weight input and add bias
-        out = np.dot(data, self.weights) + self.bias
+        out = np.dot(data, self.weights)
+        out += self.bias
         # add the previous state weighted by the peephole
         if self.peephole_weights is not None:
             out += state * self.peephole_weights
         # add recurrent connection
         out += np.dot(prev, self.recurrent_weights)
-        # apply activation function and return it
-        return self.activation_fn(out)
+        # apply activation function (in place) and return it
+        return self.activation_fn(out, out)
 
 
 class Cell(Gate):
@@ -437,13 +471,16 @@ class LSTMLayer(RecurrentLayer):
             # internal state:
             # weight the cell with the input gate
             # and add the previous state weighted by the forget gate
-            self._state = cell * ig + self._state * fg
+            # Note: reuse the cell array to avoid temporary arrays
+            cell *= ig
+            cell += self._state * fg
+            self._state = cell
             # output gate:
             # operate on current data, previous output and current state
             og = self.output_gate.activate(data_, self._prev, self._state)
             # output:
             # apply activation function to state and weight by output gate
-            out[i] = self.activation_fn(self._state) * og
+            np.multiply(self.activation_fn(self._state), og, out=out[i])
             # set reference to current output
             self._prev = out[i]
         return out
@@ -509,11 +546,12 @@ class GRUCell(Cell):
 
         """
         # weight input and add bias
-        out = np.dot(data, self.weights) + self.bias
+        out = np.dot(data, self.weights)
+        out += self.bias
         # weight previous cell output and reset gate
         out += reset_gate * np.dot(prev, self.recurrent_weights)
-        # apply activation function and return it
-        return self.activation_fn(out)
+        # apply activation function (in place) and return it
+        return self.activation_fn(out, out)
 
 
 class GRULayer(RecurrentLayer):
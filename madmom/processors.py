@@ -18,6 +18,7 @@ from __future__ import absolute_import, division, print_function
 import argparse
 import itertools as it
 import multiprocessing as mp
+import multiprocessing.dummy
 import os
 import sys
 from collections import MutableSequence
@@ -419,6 +420,51 @@ class SequentialProcessor(MutableSequence, Processor):
             data = _process((processor, data, kwargs))
         return data
 
+    def compile(self):
+        """
+        Compile the processing chain into a single function.
+
+        Nested SequentialProcessors are flattened and the per-processor
+        dispatch (i.e. the type checks and tuple packing performed by
+        `process()` for every call) is resolved once, so calling the returned
+        function costs only a single Python call per processor. This is
+        mostly relevant when processing data frame-by-frame in online mode.
+
+        Returns
+        -------
+        function
+            Function which processes the data exactly as `process()` does.
+
+        Notes
+        -----
+        The returned function is bound to the current processing chain;
+        modifications of the chain after compiling are not reflected.
+
+        """
+        # flatten the processing chain
+        stages = []
+        for processor in self.processors:
+            # Note: flatten only plain SequentialProcessors, subclasses (e.g.
+            #       ParallelProcessor) may define other processing behaviour
+            if type(processor) is SequentialProcessor:
+                stages.extend(processor.compile().stages)
+            elif processor is not None:
+                stages.append(processor)
+        # resolve the dispatch per processor once; only Processor instances
+        # get the keyword arguments passed (same logic as in _process())
+        funcs = [(processor.process if isinstance(processor, Processor)
+                  else processor, isinstance(processor, Processor))
+                 for processor in stages]
+
+        def _compiled(data, **kwargs):
+            for func, pass_kwargs in funcs:
+                data = func(data, **kwargs) if pass_kwargs else func(data)
+            return data
+
+        # expose the flattened chain (needed to flatten nested processors)
+        _compiled.stages = stages
+        return _compiled
+
 
 # inherit from SequentialProcessor because of append() and extend()
 class ParallelProcessor(SequentialProcessor):
@@ -431,16 +477,25 @@ class ParallelProcessor(SequentialProcessor):
         Processor instances to be processed in parallel.
     num_threads : int, optional
         Number of parallel working threads.
+    backend : {'processes', 'threads'}, optional
+        Parallelisation backend; 'processes' spawns worker processes and
+        pickles the data to/from them, 'threads' uses worker threads which
+        share the data without copying.
 
     Notes
     -----
     If the `processors` list contains lists or tuples, these get wrapped as a
     :class:`SequentialProcessor`.
 
+    The 'threads' backend avoids the pickling overhead of sending the data
+    to the worker processes and back, but speeds things up only if the
+    processors spend their time in code which releases the GIL (as numpy,
+    scipy and the Cython parts of madmom do).
+
     """
     # pylint: disable=too-many-ancestors
 
-    def __init__(self, processors, num_threads=None):
+    def __init__(self, processors, num_threads=None, backend='processes'):
         # set the processing chain
         super(ParallelProcessor, self).__init__(processors)
         # number of threads
@@ -453,7 +508,12 @@ class ParallelProcessor(SequentialProcessor):
         #       whereas mp.Pool().map is not.
         self.map = map
         if min(len(processors), max(1, num_threads)) > 1:
-            self.map = mp.Pool(num_threads).map
+            if backend == 'processes':
+                self.map = mp.Pool(num_threads).map
+            elif backend == 'threads':
+                self.map = mp.dummy.Pool(num_threads).map
+            else:
+                raise ValueError('unknown backend: %s' % backend)
 
     def process(self, data, **kwargs):
         """
@@ -608,19 +668,29 @@ class _ParallelProcess(mp.Process):
     ----------
     task_queue :
         Queue with tasks, i.e. tuples ('processor', 'infile', 'outfile')
+    affinity : set of ints, optional
+        Restrict the process to run only on these CPU cores.
 
     Notes
     -----
     Usually, multiple instances are created via :func:`process_batch`.
 
+    Setting `affinity` requires `os.sched_setaffinity` (Linux only); it
+    keeps the per-worker instruction and data caches hot by preventing the
+    scheduler from bouncing the worker across cores.
+
     """
-    def __init__(self, task_queue):
+    def __init__(self, task_queue, affinity=None):
         super(_ParallelProcess, self).__init__()
         self.task_queue = task_queue
+        self.affinity = affinity
 
     def run(self):
         """Process all tasks from the task queue."""
         from .io.audio import LoadAudioFileError
+        # pin the process to the given CPU cores
+        if self.affinity is not None:
+            os.sched_setaffinity(0, self.affinity)
         while True:
             # get the task tuple
             processor, infile, outfile, kwargs = self.task_queue.get()
@@ -637,7 +707,7 @@ class _ParallelProcess(mp.Process):
 # function to batch process multiple files with a processor
 def process_batch(processor, files, output_dir=None, output_suffix=None,
                   strip_ext=True, num_workers=mp.cpu_count(), shuffle=False,
-                  **kwargs):
+                  affinities=None, **kwargs):
     """
     Process a list of files with the given Processor in batch mode.
 
@@ -657,6 +727,9 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
         Number of parallel working threads.
     shuffle : bool, optional
         Shuffle the `files` before distributing them to the working threads
+    affinities : list of sets of ints, optional
+        Pin the working threads to these CPU cores, one set per worker
+        (requires `os.sched_setaffinity`, Linux only).
 
     Notes
     -----
@@ -685,7 +758,10 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
     # create task queue
     tasks = mp.JoinableQueue()
     # create working threads
-    processes = [_ParallelProcess(tasks) for _ in range(num_workers)]
+    if affinities is not None and len(affinities) != num_workers:
+        raise ValueError('one affinity set per worker must be given')
+    processes = [_ParallelProcess(tasks, affinities[i] if affinities else None)
+                 for i in range(num_workers)]
     for p in processes:
         p.daemon = True
         p.start()
@@ -481,3 +481,44 @@ class TestRNNBeatTrackingObservationModelClass(unittest.TestCase):
                                     [[-np.inf, 0], [-1.20397281, -2.30258508],
                                      [-1.10866262, -4.60517021],
                                      [-1.09861229, -np.inf]]))
+
+
+class TestGMMPatternTrackingObservationModelClass(unittest.TestCase):
+
+    @staticmethod
+    def _gmm(means, covars, weights):
+        from madmom.ml.gmm import GMM
+        gmm = GMM(n_components=len(weights), covariance_type='diag')
+        gmm.means = np.asarray(means, dtype=np.float)
+        gmm.covars = np.asarray(covars, dtype=np.float)
+        gmm.weights = np.asarray(weights, dtype=np.float)
+        return gmm
+
+    def setUp(self):
+        # two patterns with two GMMs each (2-dimensional features)
+        self.gmms = [[self._gmm([[0, 0], [1, 1]], [[1, 1], [2, 2]],
+                                [0.6, 0.4]),
+                      self._gmm([[2, 2]], [[1, 0.5]], [1.])],
+                     [self._gmm([[0, 1], [1, 0]], [[1, 2], [2, 1]],
+                                [0.3, 0.7]),
+                      self._gmm([[3, 3]], [[2, 2]], [1.])]]
+        bss1 = BarStateSpace(3, 1, 4)
+        bss2 = BarStateSpace(4, 1, 4)
+        mpss = MultiPatternStateSpace([bss1, bss2])
+        self.om = GMMPatternTrackingObservationModel(self.gmms, mpss)
+        self.obs = np.asarray([[0.5, 0.5], [1, 2], [0, 0]], dtype=np.float)
+
+    def test_types(self):
+        self.assertIsInstance(self.om.pointers, np.ndarray)
+        self.assertIsInstance(self.om.log_densities(self.obs), np.ndarray)
+        self.assertTrue(self.om.pointers.dtype == np.uint32)
+        self.assertTrue(self.om.log_densities(self.obs).dtype == np.float)
+
+    def test_values(self):
+        # the batched scoring must yield the same densities as scoring each
+        # GMM individually
+        log_densities = self.om.log_densities(self.obs)
+        self.assertTrue(log_densities.shape == (3, 4))
+        scores = np.vstack([gmm.score(self.obs) for pattern in self.gmms
+                            for gmm in pattern]).T
+        self.assertTrue(np.allclose(log_densities, scores))
@@ -586,3 +586,31 @@ class ConvolutionalLayerClassTest(unittest.TestCase):
         self.assertTrue(np.allclose(out1, ConvolutionalLayerClassTest.O1))
         out3 = self.layer3x3.activate(self.data)
         self.assertTrue(np.allclose(out3, ConvolutionalLayerClassTest.O3))
+
+
+class TestCastClass(unittest.TestCase):
+
+    def setUp(self):
+        gru = TestGRUClass
+        self.reset_gate = layers.Gate(gru.W_xr, gru.b_r, gru.W_hr,
+                                      activation_fn=activations.sigmoid)
+        self.update_gate = layers.Gate(gru.W_xu, gru.b_u, gru.W_hu,
+                                       activation_fn=activations.sigmoid)
+        self.gru_cell = layers.GRUCell(gru.W_xhu, gru.b_hu, gru.W_hhu)
+        self.layer = layers.GRULayer(self.reset_gate, self.update_gate,
+                                     self.gru_cell)
+
+    def test_cast(self):
+        # casting must recurse into the sub-layers (i.e. gates and cell)
+        self.layer.cast(np.float32)
+        self.assertTrue(self.reset_gate.weights.dtype == np.float32)
+        self.assertTrue(self.update_gate.bias.dtype == np.float32)
+        self.assertTrue(self.gru_cell.recurrent_weights.dtype == np.float32)
+        # predictions must (almost) not change
+        out = self.layer.activate(TestGRUClass.IN)
+        self.assertTrue(np.allclose(out, TestGRUClass.OUT))
+
+    def test_cast_network(self):
+        nn = NeuralNetwork([self.layer])
+        nn.cast()
+        self.assertTrue(self.gru_cell.weights.dtype == np.float32)
@@ -26,6 +26,49 @@ class TestProcessor(unittest.TestCase):
             rnn.dump(unicode(tmp_file))
 
 
+class TestSequentialProcessor(unittest.TestCase):
+
+    def test_compile(self):
+        # nested chains get flattened, results must be identical
+        nested = SequentialProcessor([np.abs, SequentialProcessor([np.sqrt])])
+        processor = SequentialProcessor([nested, np.sum])
+        compiled = processor.compile()
+        self.assertTrue(len(compiled.stages) == 3)
+        data = np.arange(-5, 5)
+        self.assertTrue(np.allclose(compiled(data), processor(data)))
+
+    def test_compile_processor(self):
+        # Processor instances must receive the keyword arguments
+        buffer = BufferProcessor(3, init=np.zeros(3))
+        processor = SequentialProcessor([buffer, np.max])
+        compiled = processor.compile()
+        self.assertTrue(np.allclose(compiled(np.arange(2)), 1))
+        self.assertTrue(np.allclose(compiled(np.arange(2, 4)), 3))
+
+
+class TestParallelProcessor(unittest.TestCase):
+
+    def test_backends(self):
+        data = np.arange(-5, 5)
+        reference = [np.abs(data), np.sqrt(np.abs(data))]
+        # process-based backend (the default)
+        processor = ParallelProcessor([np.abs, (np.abs, np.sqrt)],
+                                      num_threads=2)
+        result = processor(data)
+        self.assertTrue(np.allclose(result[0], reference[0]))
+        self.assertTrue(np.allclose(result[1], reference[1]))
+        # thread-based backend
+        processor = ParallelProcessor([np.abs, (np.abs, np.sqrt)],
+                                      num_threads=2, backend='threads')
+        result = processor(data)
+        self.assertTrue(np.allclose(result[0], reference[0]))
+        self.assertTrue(np.allclose(result[1], reference[1]))
+        # unknown backend
+        with self.assertRaises(ValueError):
+            ParallelProcessor([np.abs, np.sqrt], num_threads=2,
+                              backend='foo')
+
+
 class TestBufferProcessor(unittest.TestCase):
 
     def test_1d(self):